@@ -5,6 +5,8 @@ import json
 import os
 import math
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from copy import deepcopy
 
@@ -30,31 +32,205 @@ DIFF_FACILE = 2
 DIFF_MOYEN = 4
 DIFF_DIFFICILE = 5
 
+MODE_TURBO = 3
+FPS = 60
+FPS_TURBO = 10
+# Ouverture aléatoire pour que les parties turbo ne se répètent pas ; au-delà, chaque coup
+# est aléatoire avec la probabilité TURBO_EPSILON (0 : l'IA joue tous ses coups)
+TURBO_COUPS_ALEATOIRES = 4
+TURBO_EPSILON = 0.0
+# Sauvegardes turbo à part (hors de load_last_save), seules les plus récentes sont gardées
+DOSSIER_TURBO = "saves_turbo"
+TURBO_SAUVEGARDES_MAX = 200
+
 TAILLE_CASE = 80
 RAYON = 35
 BANDE_HAUTE = 120
 
+CACHE_ANALYSE_TAILLE = 4096
+CACHE_ANALYSE_FICHIER = "analyse_cache.json"  # None pour garder le cache en mémoire seulement
+CACHE_ANALYSE_VERSION = 3
+
+SCORE_VICTOIRE = 100000000
+FENETRE_ASPIRATION = 30
+
+FICHIER_STATS = "stats_ia.jsonl"
+
+# Polices : (nom, taille, gras). Les chemins résolus sont gardés dans FICHIER_CACHE_POLICES
+# pour éviter le scan des polices système (fc-list sous Linux) à chaque lancement.
+POLICES = {
+    "big": ("Arial", 30, True),
+    "med": ("Arial", 25, False),
+    "small": ("Arial", 18, False),
+    "mini": ("Arial", 14, False),
+}
+FICHIER_CACHE_POLICES = "font_cache.json"
+
+
+_FENETRES_PAR_TAILLE = {}
+
+
+def fenetres_par_case(lignes, colonnes):
+    """Retourne, pour chaque case, les alignements de 4 qui la contiennent.
+
+    Chaque alignement est donné par ses 3 autres cases. Les tables sont
+    calculées une seule fois par taille de plateau.
+    """
+    tables = _FENETRES_PAR_TAILLE.get((lignes, colonnes))
+    if tables is None:
+        tables = [[[] for _ in range(colonnes)] for _ in range(lignes)]
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+            for r in range(lignes):
+                for c in range(colonnes):
+                    cases = [(r + i*dr, c + i*dc) for i in range(4)]
+                    if not all(0 <= rr < lignes and 0 <= cc < colonnes for rr, cc in cases):
+                        continue
+                    for case in cases:
+                        autres = tuple(x for x in cases if x != case)
+                        tables[case[0]][case[1]].append(autres)
+        _FENETRES_PAR_TAILLE[(lignes, colonnes)] = tables
+    return tables
+
+
+class AnalysisCache:
+    """Cache LRU des analyses de la racine (scores par colonne, exactitude de chaque score et meilleur coup).
+
+    Les entrées sont indexées par la position, la taille du plateau, le joueur
+    au trait et la profondeur de recherche. Le fichier disque optionnel n'est
+    lu qu'au premier accès et réécrit par sauver() s'il y a eu des ajouts.
+    """
+
+    def __init__(self, capacite=CACHE_ANALYSE_TAILLE, fichier=None):
+        self.capacite = capacite
+        self.fichier = fichier
+        self.entrees = OrderedDict()
+        self.lock = threading.Lock()
+        self.charge = fichier is None
+        self.modifie = False
+
+    @staticmethod
+    def cle(board, joueur, profondeur):
+        """Construit la clé d'une position (plateau encodé en base 3)."""
+        cases = "".join(str(v) for ligne in board for v in ligne)
+        return f"{len(board)}x{len(board[0])}:p{profondeur}:j{joueur}:{int(cases, 3):x}"
+
+    def _charger(self):
+        """Charge le fichier disque au premier accès (appelé avec le lock)."""
+        self.charge = True
+        if not os.path.exists(self.fichier):
+            return
+        try:
+            with open(self.fichier, "r") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_ANALYSE_VERSION:
+                return
+            for cle, (scores, best_col, exacts) in data["entrees"].items():
+                self.entrees[cle] = (scores, best_col, exacts)
+            while len(self.entrees) > self.capacite:
+                self.entrees.popitem(last=False)
+        except Exception as e:
+            print(f"✗ Erreur lors de la lecture de {self.fichier}: {e}")
+
+    def get(self, cle):
+        """Retourne (scores, best_col, exacts) ou None si la position n'a jamais été analysée."""
+        with self.lock:
+            if not self.charge:
+                self._charger()
+            entree = self.entrees.get(cle)
+            if entree is None:
+                return None
+            self.entrees.move_to_end(cle)
+            scores, best_col, exacts = entree
+            return list(scores), best_col, list(exacts)
+
+    def put(self, cle, scores, best_col, exacts):
+        """Enregistre une analyse et évince la plus ancienne si le cache est plein."""
+        with self.lock:
+            if not self.charge:
+                self._charger()
+            self.entrees[cle] = (list(scores), best_col, list(exacts))
+            self.entrees.move_to_end(cle)
+            if len(self.entrees) > self.capacite:
+                self.entrees.popitem(last=False)
+            self.modifie = True
+
+    def sauver(self):
+        """Écrit le cache sur disque s'il a changé depuis le dernier chargement."""
+        if self.fichier is None or not self.modifie:
+            return
+        with self.lock:
+            data = {"version": CACHE_ANALYSE_VERSION, "entrees": dict(self.entrees)}
+            self.modifie = False
+        try:
+            with open(self.fichier + ".tmp", "w") as f:
+                json.dump(data, f)
+            os.replace(self.fichier + ".tmp", self.fichier)
+        except Exception as e:
+            print(f"✗ Erreur lors de la sauvegarde de {self.fichier}: {e}")
+
+
+class SearchStats:
+    """Statistiques de la recherche en cours.
+
+    Les compteurs sont écrits uniquement par le thread IA, sans lock : l'interface
+    se contente de les échantillonner (une valeur légèrement en retard est sans gravité).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Remet les compteurs à zéro au début d'une recherche."""
+        self.noeuds = 0
+        self.coupures = 0
+        self.cache_hits = 0
+        self.profondeur_iteration = 0
+        self.profondeur_max = 0
+        self.temps_eval = 0.0
+        self.temps_victoire = 0.0
+        self.debut = time.perf_counter()
+        self.fin = None
+
+    def terminer(self):
+        self.fin = time.perf_counter()
+
+    def snapshot(self):
+        """Retourne une copie des compteurs sous forme de dictionnaire (exportable en JSON)."""
+        duree = (self.fin if self.fin is not None else time.perf_counter()) - self.debut
+        return {
+            "noeuds": self.noeuds,
+            "noeuds_par_s": int(self.noeuds / duree) if duree > 0 else 0,
+            "coupures": self.coupures,
+            "cache_hits": self.cache_hits,
+            "profondeur_max": self.profondeur_max,
+            "duree_s": round(duree, 4),
+            "temps_eval_s": round(self.temps_eval, 4),
+            "temps_victoire_s": round(self.temps_victoire, 4),
+        }
+
 
 class ConnectFourGame:
     """Classe principale du jeu Puissance 4 avec IA Minimax."""
     
-    def __init__(self):
-        pygame.init()
-        self.clock = pygame.time.Clock()
+    def __init__(self, affichage=True):
+        """Initialise le jeu. Avec affichage=False, seul le moteur est prêt (pas de fenêtre ni config.json)."""
         self.config = {"lignes": 8, "colonnes": 9, "joueur_start": 1}
-        self.charger_config()
-        self.setup_display()
-
-        # Fonts
-        self.font_big = pygame.font.SysFont("Arial", 30, bold=True)
-        self.font_med = pygame.font.SysFont("Arial", 25)
-        self.font_small = pygame.font.SysFont("Arial", 18)
-        self.font_mini = pygame.font.SysFont("Arial", 14)
+        self.config_modifiee = False
+        self.polices = {}
+        self.chemins_polices = None
+        if affichage:
+            # Seuls l'affichage et les polices servent (pas de son ni de joystick)
+            pygame.display.init()
+            pygame.font.init()
+            self.clock = pygame.time.Clock()
+            self.charger_config()
+            self.setup_display()
 
         # State
         self.state = MENU
-        self.mode_jeu = 1  # 0 = 0 joueurs, 1 = 1 joueur vs IA, 2 = 2 joueurs
+        self.mode_jeu = 1  # 0 = 0 joueurs, 1 = 1 joueur vs IA, 2 = 2 joueurs, 3 = turbo IA vs IA
         self.difficulte = DIFF_FACILE
+        self.difficulte_turbo = {1: DIFF_MOYEN, 2: DIFF_MOYEN}
         self.reset_game_data()
         
         # IA state
@@ -65,6 +241,78 @@ class ConnectFourGame:
         self.ai_thread = None
         self.ai_scores_lock = threading.Lock()
         self.current_col_computing = -1
+        self.cache_analyse = AnalysisCache(CACHE_ANALYSE_TAILLE, CACHE_ANALYSE_FICHIER if affichage else None)
+        self.stats = SearchStats()
+        self.afficher_stats = False
+        self.exporter_stats = False
+        
+        # Mode turbo
+        self.turbo_lock = threading.Lock()
+        self.turbo_thread = None
+        self.turbo_moteur = None
+        self.turbo_session = 0
+        self.turbo_parties = 0
+        self.turbo_coups = 0
+        self.turbo_debut = 0
+
+    # ============================
+    # POLICES
+    # ============================
+
+    @property
+    def font_big(self):
+        return self.police("big")
+
+    @property
+    def font_med(self):
+        return self.police("med")
+
+    @property
+    def font_small(self):
+        return self.police("small")
+
+    @property
+    def font_mini(self):
+        return self.police("mini")
+
+    def police(self, cle):
+        """Retourne la police demandée, créée au premier usage."""
+        font = self.polices.get(cle)
+        if font is None:
+            nom, taille, gras = POLICES[cle]
+            chemin, faux_gras = self.resoudre_police(nom, gras)
+            font = pygame.font.Font(chemin, taille)
+            font.set_bold(faux_gras)
+            self.polices[cle] = font
+        return font
+
+    def resoudre_police(self, nom, gras):
+        """Retourne (fichier, gras simulé) comme SysFont, en passant par FICHIER_CACHE_POLICES."""
+        if self.chemins_polices is None:
+            self.chemins_polices = {}
+            if os.path.exists(FICHIER_CACHE_POLICES):
+                try:
+                    with open(FICHIER_CACHE_POLICES, "r") as f:
+                        self.chemins_polices = json.load(f)
+                except Exception as e:
+                    print(f"✗ Erreur lors de la lecture de {FICHIER_CACHE_POLICES}: {e}")
+        
+        cle = f"{nom}|{'gras' if gras else 'normal'}"
+        entree = self.chemins_polices.get(cle)
+        if entree is not None and (entree[0] is None or os.path.exists(entree[0])):
+            return entree
+        
+        # Résolution complète (scan des polices système), une seule fois par machine
+        chemin = pygame.font.match_font(nom, bold=gras)
+        faux_gras = gras and (chemin is None or chemin == pygame.font.match_font(nom))
+        entree = [chemin, faux_gras]
+        self.chemins_polices[cle] = entree
+        try:
+            with open(FICHIER_CACHE_POLICES, "w") as f:
+                json.dump(self.chemins_polices, f, indent=2)
+        except Exception as e:
+            print(f"✗ Erreur lors de la sauvegarde de {FICHIER_CACHE_POLICES}: {e}")
+        return entree
 
     def setup_display(self):
         """Configure la fenêtre selon la taille du plateau."""
@@ -84,6 +332,7 @@ class ConnectFourGame:
         self.gagnants = []
         self.partie_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.scores_ia = [None]*self.config["colonnes"]
+        self.scores_exacts = [False]*self.config["colonnes"]
         self.ia_thinking_progress = 0
         self.ai_computing = False
         self.ai_col_to_play = None
@@ -96,7 +345,7 @@ class ConnectFourGame:
     # ============================
     
     def charger_config(self):
-        """Charge la configuration depuis config.json. Crée le fichier s'il n'existe pas."""
+        """Charge la configuration depuis config.json. S'il n'existe pas, il sera créé à la sortie des paramètres ou du jeu."""
         if os.path.exists("config.json"):
             try:
                 with open("config.json", "r") as f:
@@ -106,21 +355,21 @@ class ConnectFourGame:
                 print(f"✗ Erreur lors de la lecture de config.json: {e}")
                 print("  Utilisation de la configuration par défaut.")
         else:
-            # Créer config.json avec la configuration par défaut
-            print("✓ config.json introuvable. Création avec la configuration par défaut...")
-            self.sauver_config()
-            print("✓ config.json créé avec succès.")
+            # L'écriture est différée pour ne pas retarder la première image
+            print("✓ config.json introuvable. Utilisation de la configuration par défaut.")
+            self.config_modifiee = True
 
     def sauver_config(self):
         """Sauvegarde la configuration dans config.json (formaté pour lisibilité)."""
         try:
             with open("config.json", "w") as f:
                 json.dump(self.config, f, indent=2)
+            self.config_modifiee = False
         except Exception as e:
             print(f"✗ Erreur lors de la sauvegarde de config.json: {e}")
 
-    def sauvegarder_partie(self):
-        """Sauvegarde la partie en cours."""
+    def sauvegarder_partie(self, dossier=None):
+        """Sauvegarde la partie en cours (dans le dossier courant par défaut)."""
         data = {
             "id": self.partie_id,
             "config": self.config,
@@ -128,7 +377,12 @@ class ConnectFourGame:
             "mode": self.mode_jeu,
             "diff": self.difficulte
         }
+        if self.mode_jeu == MODE_TURBO:
+            data["diff_turbo"] = self.difficulte_turbo
         filename = f"save_{self.partie_id}.json"
+        if dossier is not None:
+            os.makedirs(dossier, exist_ok=True)
+            filename = os.path.join(dossier, filename)
         with open(filename, "w") as f:
             json.dump(data, f, indent=2)
         self.show_temp_message(f"Partie sauvegardée: {filename}")
@@ -147,6 +401,9 @@ class ConnectFourGame:
             self.partie_id = data["id"]
             self.mode_jeu = data["mode"]
             self.difficulte = data.get("diff", DIFF_FACILE)
+            if "diff_turbo" in data:
+                # Les clés JSON sont des chaînes : on revient aux numéros de joueur
+                self.difficulte_turbo = {int(j): d for j, d in data["diff_turbo"].items()}
             for move in data["historique"]:
                 col, lig, jou = move
                 self.plateau[lig][col] = jou
@@ -198,7 +455,7 @@ class ConnectFourGame:
         self.game_over = False
         self.gagnants = []
         self.message = ""
-        self.scores_ia = [None]*self.config["colonnes"]
+        self.scores_ia, self.scores_exacts = self.scores_depuis_cache()
 
     def redo_coup(self):
         """Refait le dernier coup annulé (Ctrl+Y)."""
@@ -208,6 +465,7 @@ class ConnectFourGame:
         self.plateau[lig][col] = joueur
         self.historique.append((col, lig, joueur))
         self.verifier_victoire_et_tour()
+        self.scores_ia, self.scores_exacts = self.scores_depuis_cache()
 
     def verifier_victoire_et_tour(self):
         """Vérifie la victoire et change de tour."""
@@ -312,73 +570,205 @@ class ConnectFourGame:
         
         return score
 
-    def is_terminal_node(self, board):
-        """Vérifie si le nœud est terminal (victoire ou plateau plein)."""
-        return self.check_victory_coords(board) is not None or len(self.get_valid_moves(board)) == 0
-
     def get_valid_moves(self, board):
         """Retourne la liste des colonnes jouables."""
         return [c for c in range(self.config["colonnes"]) if board[0][c] == 0]
 
-    def minimax(self, board, depth, alpha, beta, maximizing_player, joueur_ia):
-        """Algorithme Minimax avec élagage alpha-beta."""
-        # Progression mise à jour de manière thread-safe
-        with self.ai_scores_lock:
-            self.ia_thinking_progress = min(100, self.ia_thinking_progress + 0.3)
+    def ordonner_coups(self, valid_moves, premier=None):
+        """Trie les coups du centre vers les bords, en commençant par `premier` s'il est donné."""
+        centre = self.config["colonnes"] // 2
+        ordre = sorted(valid_moves, key=lambda c: abs(c - centre))
+        if premier in ordre:
+            ordre.remove(premier)
+            ordre.insert(0, premier)
+        return ordre
+
+    def gagnant_en(self, board, r, c):
+        """Indique qui alignerait 4 pions en jouant la case (r, c) : bit 1 = ROUGE, bit 2 = JAUNE."""
+        gagnants = 0
+        for (r1, c1), (r2, c2), (r3, c3) in fenetres_par_case(len(board), len(board[0]))[r][c]:
+            v = board[r1][c1]
+            if v != 0 and v == board[r2][c2] == board[r3][c3]:
+                gagnants |= v
+                if gagnants == 3:
+                    break
+        return gagnants
+
+    def analyser_menaces(self, board, joueur, valid_moves):
+        """Analyse tactique de la position, `joueur` étant au trait.
+
+        Retourne (gagnants, blocages, interdits) :
+          - gagnants : colonnes où `joueur` gagne immédiatement
+          - blocages : colonnes où l'adversaire gagnerait immédiatement
+          - interdits : colonnes qui libèrent une case gagnante pour l'adversaire juste au-dessus
+        """
+        adversaire = 3 - joueur
+        gagnants, blocages, interdits = [], [], []
+        for col in valid_moves:
+            row = self.obtenir_ligne_vide(board, col)
+            menace = self.gagnant_en(board, row, col)
+            if menace & joueur:
+                gagnants.append(col)
+            if menace & adversaire:
+                blocages.append(col)
+            if row > 0 and self.gagnant_en(board, row - 1, col) & adversaire:
+                interdits.append(col)
+        return gagnants, blocages, interdits
+
+    def cree_double_menace(self, board, joueur, col):
+        """Vrai si jouer `col` donne à `joueur` deux coups gagnants sans victoire immédiate pour l'adversaire."""
+        row = self.obtenir_ligne_vide(board, col)
+        board[row][col] = joueur
+        valid_moves = self.get_valid_moves(board)
+        gagnants, blocages, _ = self.analyser_menaces(board, 3 - joueur, valid_moves)
+        board[row][col] = 0
+        return not gagnants and len(blocages) >= 2
+
+    def negamax(self, board, depth, alpha, beta, joueur, joueur_ia):
+        """Negamax avec élagage alpha-beta et recherche à fenêtre nulle (PVS).
+
+        Le score est donné du point de vue de `joueur` (le joueur au trait).
+        L'évaluation reste celle de `joueur_ia`, de signe opposé pour l'adversaire,
+        ce qui donne exactement les mêmes valeurs que l'ancien Minimax.
+        Le plateau est modifié puis restauré sur place.
+
+        Les positions forcées sont résolues avant de brancher (analyser_menaces).
+        Un coup gagnant n'est jamais joué : le plateau reçu ne contient donc pas
+        d'alignement, et chaque règle n'est appliquée qu'à une profondeur où
+        l'ancien Minimax aurait trouvé le même score.
+        """
+        stats = self.stats
+        stats.noeuds += 1
+        ply = stats.profondeur_iteration - depth
+        if ply > stats.profondeur_max:
+            stats.profondeur_max = ply
         
         valid_moves = self.get_valid_moves(board)
-        is_terminal = self.is_terminal_node(board)
-        
-        if depth == 0 or is_terminal:
-            if is_terminal:
-                if self.check_victory_coords(board):
-                    # Vérifier qui a gagné
-                    winner_coords = self.check_victory_coords(board)
-                    winner = board[winner_coords[0][0]][winner_coords[0][1]]
-                    if winner == joueur_ia:
-                        return (None, 100000000)
-                    else:
-                        return (None, -100000000)
-                else:  # Match nul
-                    return (None, 0)
-            else:  # depth == 0
-                return (None, self.score_position(board, joueur_ia))
-        
-        if maximizing_player:
-            value = -math.inf
-            best_col = random.choice(valid_moves) if valid_moves else None
-            for col in valid_moves:
-                row = self.obtenir_ligne_vide(board, col)
-                temp_board = [row[:] for row in board]
-                temp_board[row][col] = joueur_ia
-                new_score = self.minimax(temp_board, depth-1, alpha, beta, False, joueur_ia)[1]
-                if new_score > value:
-                    value = new_score
-                    best_col = col
-                alpha = max(alpha, value)
-                if alpha >= beta:
-                    break
-            return best_col, value
-        else:
-            value = math.inf
-            best_col = random.choice(valid_moves) if valid_moves else None
-            for col in valid_moves:
-                row = self.obtenir_ligne_vide(board, col)
-                temp_board = [row[:] for row in board]
-                temp_board[row][col] = 3 - joueur_ia
-                new_score = self.minimax(temp_board, depth-1, alpha, beta, True, joueur_ia)[1]
-                if new_score < value:
-                    value = new_score
-                    best_col = col
-                beta = min(beta, value)
-                if alpha >= beta:
-                    break
-            return best_col, value
+        if not valid_moves:  # Match nul
+            return 0
+        if depth == 0:
+            t = time.perf_counter()
+            score = self.score_position(board, joueur_ia)
+            stats.temps_eval += time.perf_counter() - t
+            return score if joueur == joueur_ia else -score
+        
+        t = time.perf_counter()
+        gagnants, blocages, interdits = self.analyser_menaces(board, joueur, valid_moves)
+        stats.temps_victoire += time.perf_counter() - t
+        if gagnants:
+            return SCORE_VICTOIRE
+        
+        coups = valid_moves
+        if depth >= 2:
+            if len(blocages) >= 2:
+                # Impossible de bloquer deux colonnes
+                return -SCORE_VICTOIRE
+            if blocages:
+                # Coup forcé : tout autre coup perd
+                coups = blocages
+            else:
+                coups = [c for c in valid_moves if c not in interdits]
+                if not coups:
+                    return -SCORE_VICTOIRE
+                if depth >= 3:
+                    t = time.perf_counter()
+                    double = any(self.cree_double_menace(board, joueur, c) for c in coups)
+                    stats.temps_victoire += time.perf_counter() - t
+                    if double:
+                        return SCORE_VICTOIRE
+        
+        value = -math.inf
+        premier = True
+        for col in self.ordonner_coups(coups):
+            row = self.obtenir_ligne_vide(board, col)
+            board[row][col] = joueur
+            if premier:
+                score = -self.negamax(board, depth-1, -beta, -alpha, 3 - joueur, joueur_ia)
+                premier = False
+            else:
+                # Fenêtre nulle : le coup fait-il mieux que alpha ?
+                score = -self.negamax(board, depth-1, -alpha-1, -alpha, 3 - joueur, joueur_ia)
+                if alpha < score < beta:
+                    score = -self.negamax(board, depth-1, -beta, -score, 3 - joueur, joueur_ia)
+            board[row][col] = 0
+            if score > value:
+                value = score
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                stats.coupures += 1
+                break
+        return value
+
+    def rechercher_racine(self, board, depth, alpha, beta, joueur_ia, ordre, afficher):
+        """Recherche PVS à la racine dans la fenêtre (alpha, beta).
+
+        Retourne (meilleure colonne, score, scores par colonne, exactitude par colonne).
+        À score égal, la colonne la plus à gauche est préférée comme dans l'ancien
+        Minimax. Le score d'une colonne rejetée par fenêtre nulle n'est qu'une borne
+        supérieure : son entrée dans `exacts` vaut alors False.
+        """
+        scores = [None]*self.config["colonnes"]
+        exacts = [False]*self.config["colonnes"]
+        best_col, best = None, -math.inf
+        for idx, col in enumerate(ordre):
+            if afficher:
+                with self.ai_scores_lock:
+                    self.current_col_computing = col
+                    self.ia_thinking_progress = (idx / len(ordre)) * 100
+            
+            row = self.obtenir_ligne_vide(board, col)
+            if self.gagnant_en(board, row, col) & joueur_ia:
+                score = SCORE_VICTOIRE
+                exact = True
+            elif best_col is None:
+                board[row][col] = joueur_ia
+                score = -self.negamax(board, depth-1, -beta, -alpha, 3 - joueur_ia, joueur_ia)
+                exact = alpha < score < beta
+            else:
+                board[row][col] = joueur_ia
+                # Une colonne plus à gauche remplace la meilleure dès qu'elle l'égale
+                seuil = max(alpha, best - 1 if col < best_col else best)
+                score = -self.negamax(board, depth-1, -seuil-1, -seuil, 3 - joueur_ia, joueur_ia)
+                exact = False
+                if seuil < score < beta:
+                    score = -self.negamax(board, depth-1, -beta, -seuil, 3 - joueur_ia, joueur_ia)
+                    exact = seuil < score < beta
+            board[row][col] = 0
+            
+            scores[col] = score
+            exacts[col] = exact
+            if afficher:
+                with self.ai_scores_lock:
+                    self.scores_ia[col] = score
+                    self.scores_exacts[col] = exact
+            if best_col is None or score > best or (score == best and col < best_col):
+                best_col, best = col, score
+            if best >= beta:
+                break
+        return best_col, best, scores, exacts
 
-    def get_ai_move_minimax(self):
-        """Calcule le meilleur coup avec Minimax et affiche les scores en temps réel."""
+    def scores_depuis_cache(self):
+        """Retourne (scores, exacts) déjà calculés pour la position courante (None par colonne sinon)."""
+        vide = ([None]*self.config["colonnes"], [False]*self.config["colonnes"])
+        if self.game_over or self.difficulte == DIFF_ALEATOIRE:
+            return vide
+        cle = AnalysisCache.cle(self.plateau, self.tour, self.difficulte)
+        analyse = self.cache_analyse.get(cle)
+        return (analyse[0], analyse[2]) if analyse else vide
+
+    def get_ai_move_minimax(self, profondeur=None, utiliser_cache=True):
+        """Calcule le meilleur coup avec Minimax et affiche les scores en temps réel.
+
+        `profondeur` remplace la difficulté courante (mode turbo, un niveau par joueur).
+        Avec utiliser_cache=False, le cache d'analyse n'est ni lu ni alimenté
+        (le mode turbo doit réellement faire travailler le moteur).
+        """
+        if profondeur is None:
+            profondeur = self.difficulte
         with self.ai_scores_lock:
             self.ia_thinking_progress = 0
+        self.stats.reset()
         
         joueur_ia = self.tour
         valid_moves = self.get_valid_moves(self.plateau)
@@ -386,47 +776,52 @@ class ConnectFourGame:
         if not valid_moves:
             return None
         
-        # Calculer les scores pour chaque colonne progressivement
-        scores = []
-        total_moves = len(valid_moves)
-        
-        for idx, col in enumerate(range(self.config["colonnes"])):
-            # Indiquer quelle colonne est en cours de calcul
+        # Position déjà analysée à cette profondeur : réponse immédiate
+        cle = AnalysisCache.cle(self.plateau, joueur_ia, profondeur)
+        analyse = self.cache_analyse.get(cle) if utiliser_cache else None
+        if analyse is not None:
+            self.stats.cache_hits += 1
+            self.stats.terminer()
             with self.ai_scores_lock:
-                self.current_col_computing = col
-            
-            if col in valid_moves:
-                row = self.obtenir_ligne_vide(self.plateau, col)
-                temp_board = [row[:] for row in self.plateau]
-                temp_board[row][col] = joueur_ia
-                
-                # Reset progression pour cette colonne
-                with self.ai_scores_lock:
-                    self.ia_thinking_progress = (idx / total_moves) * 100
-                
-                score = self.minimax(temp_board, self.difficulte-1, -math.inf, math.inf, False, joueur_ia)[1]
-                scores.append((col, score))
-                
-                # Mettre à jour le score en temps réel (thread-safe)
-                with self.ai_scores_lock:
-                    self.scores_ia[col] = score
+                self.scores_ia = analyse[0]
+                self.scores_exacts = analyse[2]
+                self.ia_thinking_progress = 100
+                self.current_col_computing = -1
+            return analyse[1]
+        
+        # Approfondissement itératif : chaque itération fournit le coup à essayer
+        # en premier et le centre de la fenêtre d'aspiration de la suivante
+        board = [row[:] for row in self.plateau]
+        best_col, best = None, 0
+        for depth in range(1, profondeur + 1):
+            final = depth == profondeur
+            self.stats.profondeur_iteration = depth
+            ordre = self.ordonner_coups(valid_moves, best_col)
+            if depth == 1 or abs(best) >= SCORE_VICTOIRE:
+                alpha, beta = -math.inf, math.inf
             else:
-                scores.append((col, None))
-                with self.ai_scores_lock:
-                    self.scores_ia[col] = None
+                alpha, beta = best - FENETRE_ASPIRATION, best + FENETRE_ASPIRATION
+            while True:
+                col, score, scores, exacts = self.rechercher_racine(board, depth, alpha, beta, joueur_ia, ordre, final)
+                if score <= alpha:
+                    alpha = -math.inf
+                elif score >= beta:
+                    beta = math.inf
+                else:
+                    break
+            best_col, best = col, score
         
         # Calcul terminé
+        self.stats.terminer()
         with self.ai_scores_lock:
+            self.scores_ia = scores
+            self.scores_exacts = exacts
             self.ia_thinking_progress = 100
             self.current_col_computing = -1
         
-        # Choisir le meilleur coup
-        valid_scores = [(c, s) for c, s in scores if s is not None]
-        if valid_scores:
-            best_col = max(valid_scores, key=lambda x: x[1])[0]
-            return best_col
-        
-        return random.choice(valid_moves)
+        if utiliser_cache:
+            self.cache_analyse.put(cle, scores, best_col, exacts)
+        return best_col
 
     def get_ai_move_random(self):
         """Retourne un coup aléatoire."""
@@ -443,12 +838,128 @@ class ConnectFourGame:
             col = self.get_ai_move_random()
         else:
             col = self.get_ai_move_minimax()
+            if self.exporter_stats:
+                self.exporter_stats_coup(col, self.difficulte)
         
         self.ai_col_to_play = col
+
+    def exporter_stats_coup(self, col, profondeur):
+        """Ajoute les statistiques de la dernière recherche à FICHIER_STATS (une ligne JSON par coup)."""
+        data = {
+            "partie": self.partie_id,
+            "coup": len(self.historique) + 1,
+            "colonne": col,
+            "difficulte": profondeur,
+            "lignes": self.config["lignes"],
+            "colonnes": self.config["colonnes"],
+        }
+        data.update(self.stats.snapshot())
+        try:
+            with open(FICHIER_STATS, "a") as f:
+                f.write(json.dumps(data) + "\n")
+        except Exception as e:
+            print(f"✗ Erreur lors de l'export des statistiques: {e}")
     
+    def turbo_compute_thread(self, session, moteur):
+        """Thread du mode turbo : enchaîne coups et parties sans attendre l'affichage.
+
+        Le thread joue sur son propre moteur (plateau, scores, statistiques) et ne
+        publie l'état vers l'interface que sous turbo_lock, après avoir vérifié sa
+        session : un thread arrêté ne touche donc plus à l'état du jeu. Les fichiers
+        de sauvegarde sont écrits après avoir relâché le verrou.
+        """
+        while self.turbo_session == session:
+            if moteur.game_over:
+                with self.turbo_lock:
+                    if self.turbo_session != session:
+                        break
+                    moteur.difficulte_turbo = dict(self.difficulte_turbo)
+                    self.turbo_parties += 1
+                    numero = self.turbo_parties
+                # Écriture hors du verrou pour ne pas bloquer le rendu ; le moteur
+                # appartient au thread, la partie sauvegardée ne peut donc pas changer
+                moteur.sauvegarder_partie(DOSSIER_TURBO)
+                self.nettoyer_sauvegardes_turbo()
+                moteur.reset_game_data()
+                # Plusieurs parties par seconde : l'horodatage seul ne suffit pas
+                moteur.partie_id += f"_{numero:05d}"
+            else:
+                profondeur = self.difficulte_turbo[moteur.tour]
+                if (profondeur == DIFF_ALEATOIRE or len(moteur.historique) < TURBO_COUPS_ALEATOIRES
+                        or random.random() < TURBO_EPSILON):
+                    col = moteur.get_ai_move_random()
+                else:
+                    col = moteur.get_ai_move_minimax(profondeur, utiliser_cache=False)
+                    if self.exporter_stats:
+                        moteur.exporter_stats_coup(col, profondeur)
+                moteur.jouer_coup(col)
+                self.turbo_coups += 1
+            
+            with self.turbo_lock:
+                if self.turbo_session != session:
+                    break
+                self.copier_etat_turbo(moteur)
+
+    def copier_etat_turbo(self, moteur):
+        """Recopie la partie du moteur turbo dans l'état affiché (appelé sous turbo_lock)."""
+        self.plateau = [row[:] for row in moteur.plateau]
+        self.historique = list(moteur.historique)
+        self.tour = moteur.tour
+        self.game_over = moteur.game_over
+        self.gagnants = list(moteur.gagnants)
+        self.message = moteur.message
+        self.partie_id = moteur.partie_id
+
+    def nettoyer_sauvegardes_turbo(self):
+        """Ne garde que les TURBO_SAUVEGARDES_MAX dernières parties turbo."""
+        saves = sorted(f for f in os.listdir(DOSSIER_TURBO) if f.startswith("save_") and f.endswith(".json"))
+        for f in saves[:-TURBO_SAUVEGARDES_MAX]:
+            try:
+                os.remove(os.path.join(DOSSIER_TURBO, f))
+            except OSError:
+                pass
+
+    def demarrer_turbo(self):
+        """Lance le thread turbo (une seule session à la fois)."""
+        if self.turbo_thread is not None and self.turbo_thread.is_alive():
+            return
+        # Moteur propre au thread, repartant de la partie affichée (éventuellement chargée)
+        moteur = ConnectFourGame(affichage=False)
+        moteur.config = dict(self.config)
+        moteur.mode_jeu = MODE_TURBO
+        moteur.difficulte = self.difficulte
+        moteur.reset_game_data()
+        moteur.plateau = [row[:] for row in self.plateau]
+        moteur.historique = list(self.historique)
+        moteur.tour = self.tour
+        moteur.game_over = self.game_over
+        moteur.gagnants = list(self.gagnants)
+        moteur.partie_id = self.partie_id
+        
+        self.turbo_moteur = moteur
+        self.turbo_parties = 0
+        self.turbo_coups = 0
+        self.turbo_debut = time.perf_counter()
+        self.turbo_thread = threading.Thread(target=self.turbo_compute_thread,
+                                             args=(self.turbo_session, moteur), daemon=True)
+        self.turbo_thread.start()
+
+    def arreter_turbo(self):
+        """Invalide la session turbo : le thread finit son calcul sur son propre moteur puis s'arrête sans rien publier."""
+        with self.turbo_lock:
+            self.turbo_session += 1
+
     def update_ai_move(self):
         """Gère le tour de l'IA avec calcul en arrière-plan."""
-        if self.game_over or self.state != JEU:
+        if self.state != JEU:
+            return
+        
+        # Mode turbo: le thread joue seul, l'affichage ne fait qu'échantillonner
+        if self.mode_jeu == MODE_TURBO:
+            self.demarrer_turbo()
+            return
+        
+        if self.game_over:
             return
         
         # Mode 0 joueurs: les deux jouent automatiquement
@@ -554,6 +1065,47 @@ class ConnectFourGame:
             else:
                 prog_text = self.font_mini.render(f"IA calcule... {int(current_progress)}%", True, BLANC)
             self.ecran.blit(prog_text, (bar_x, bar_y + bar_height + 2))
+        
+        # Compteurs du mode turbo
+        if self.mode_jeu == MODE_TURBO:
+            self.draw_turbo_info()
+        
+        # Statistiques de recherche (touche T)
+        if self.afficher_stats:
+            self.draw_stats_overlay()
+
+    def draw_turbo_info(self):
+        """Affiche les parties par minute et les niveaux du mode turbo."""
+        duree = time.perf_counter() - self.turbo_debut
+        par_minute = self.turbo_parties * 60 / duree if duree > 0 else 0
+        par_seconde = self.turbo_coups / duree if duree > 0 else 0
+        lignes = [
+            f"TURBO {par_minute:.1f} parties/min | {par_seconde:.1f} coups/s",
+            f"{self.turbo_parties} parties | ROUGE {self.get_difficulty_name(self.difficulte_turbo[1])}"
+            f" vs JAUNE {self.get_difficulty_name(self.difficulte_turbo[2])}",
+        ]
+        y = 10
+        for ligne in lignes:
+            surf = self.font_small.render(ligne, True, ORANGE)
+            self.ecran.blit(surf, (self.ecran.get_width() - surf.get_width() - 10, y))
+            y += 20
+
+    def draw_stats_overlay(self):
+        """Affiche les statistiques de la recherche en cours ou de la dernière recherche."""
+        if self.mode_jeu == MODE_TURBO and self.turbo_moteur is not None:
+            st = self.turbo_moteur.stats.snapshot()
+        else:
+            st = self.stats.snapshot()
+        lignes = [
+            f"Noeuds {st['noeuds']} | {st['noeuds_par_s']} n/s | Coupures {st['coupures']} | Cache {st['cache_hits']}",
+            f"Prof. {st['profondeur_max']} | {st['duree_s']:.2f}s | Eval {st['temps_eval_s']:.2f}s"
+            f" | Victoire {st['temps_victoire_s']:.2f}s",
+        ]
+        y = 50
+        for ligne in lignes:
+            surf = self.font_mini.render(ligne, True, GRIS)
+            self.ecran.blit(surf, (self.ecran.get_width() - surf.get_width() - 10, y))
+            y += 15
 
     def draw_ai_scores(self):
         """Affiche les scores Minimax sous chaque colonne en temps réel."""
@@ -562,6 +1114,7 @@ class ConnectFourGame:
             if self.ai_computing or (self.tour == 2 and any(s is not None for s in self.scores_ia)):
                 with self.ai_scores_lock:
                     scores_copy = self.scores_ia.copy()
+                    exacts_copy = self.scores_exacts.copy()
                     current_col = self.current_col_computing
                 
                 for col in range(self.config["colonnes"]):
@@ -573,8 +1126,15 @@ class ConnectFourGame:
                         pygame.draw.circle(self.ecran, ORANGE, (x, y), 12)
                     
                     if scores_copy[col] is not None:
-                        score_text = str(int(scores_copy[col]))
-                        color = JAUNE if col != current_col else BLANC
+                        # Une borne supérieure (coup écarté par fenêtre nulle) est affichée en gris
+                        if exacts_copy[col]:
+                            score_text = str(int(scores_copy[col]))
+                            color = JAUNE
+                        else:
+                            score_text = f"≤{int(scores_copy[col])}"
+                            color = GRIS
+                        if col == current_col:
+                            color = BLANC
                         surf = self.font_mini.render(score_text, True, color)
                         rect = surf.get_rect(center=(x, y))
                         self.ecran.blit(surf, rect)
@@ -592,7 +1152,7 @@ class ConnectFourGame:
         self.draw_ai_scores()
         
         # Instructions
-        inst_text = "M: Menu | S: Save | L: Load | R: Reset | Ctrl+Z: Undo | Ctrl+Y: Redo"
+        inst_text = "M: Menu | S: Save | L: Load | R: Reset | Ctrl+Z: Undo | Ctrl+Y: Redo | T: Stats | E: Export"
         inst_surf = self.font_mini.render(inst_text, True, GRIS)
         self.ecran.blit(inst_surf, (5, self.ecran.get_height() - 20))
 
@@ -608,17 +1168,18 @@ class ConnectFourGame:
             "0 - Mode 0 joueurs (Auto)",
             "1 - Mode 1 joueur vs IA",
             "2 - Mode 2 joueurs",
+            "3 - Mode Turbo IA vs IA",
             "P - Paramètres",
             "L - Charger partie",
             "Q - Quitter"
         ]
         
-        y = 150
+        y = 130
         for opt in options:
             surf = self.font_med.render(opt, True, BLANC)
             rect = surf.get_rect(center=(self.ecran.get_width()//2, y))
             self.ecran.blit(surf, rect)
-            y += 50
+            y += 45
 
     def draw_settings(self):
         """Dessine le menu des paramètres."""
@@ -633,6 +1194,8 @@ class ConnectFourGame:
             f"Colonnes: {self.config['colonnes']} (Flèches Gauche/Droite)",
             f"Joueur départ: {'ROUGE' if self.config['joueur_start'] == 1 else 'JAUNE'} (J)",
             f"Difficulté IA: {self.get_difficulty_name()} (D)",
+            f"Turbo: ROUGE {self.get_difficulty_name(self.difficulte_turbo[1])} (1)"
+            f" / JAUNE {self.get_difficulty_name(self.difficulte_turbo[2])} (2)",
             "",
             "Entrée - Retour au menu",
         ]
@@ -644,17 +1207,25 @@ class ConnectFourGame:
             self.ecran.blit(surf, rect)
             y += 45
 
-    def get_difficulty_name(self):
-        """Retourne le nom de la difficulté."""
-        if self.difficulte == DIFF_ALEATOIRE:
+    def get_difficulty_name(self, difficulte=None):
+        """Retourne le nom de la difficulté (par défaut celle du mode 1 joueur)."""
+        if difficulte is None:
+            difficulte = self.difficulte
+        if difficulte == DIFF_ALEATOIRE:
             return "Aléatoire"
-        elif self.difficulte == DIFF_FACILE:
+        elif difficulte == DIFF_FACILE:
             return "Facile (2)"
-        elif self.difficulte == DIFF_MOYEN:
+        elif difficulte == DIFF_MOYEN:
             return "Moyen (4)"
-        elif self.difficulte == DIFF_DIFFICILE:
+        elif difficulte == DIFF_DIFFICILE:
             return "Difficile (5)"
-        return f"Perso ({self.difficulte})"
+        return f"Perso ({difficulte})"
+
+    def difficulte_suivante(self, difficulte):
+        """Retourne le niveau suivant dans le cycle des difficultés."""
+        difficulties = [DIFF_ALEATOIRE, DIFF_FACILE, DIFF_MOYEN, DIFF_DIFFICILE]
+        current_idx = difficulties.index(difficulte) if difficulte in difficulties else 1
+        return difficulties[(current_idx + 1) % len(difficulties)]
 
     # ============================
     # GESTION ÉVÉNEMENTS
@@ -665,8 +1236,8 @@ class ConnectFourGame:
         if self.game_over or self.ai_computing:
             return
         
-        # Mode 0 joueurs: pas de clics
-        if self.mode_jeu == 0:
+        # Mode 0 joueurs et turbo: pas de clics
+        if self.mode_jeu in (0, MODE_TURBO):
             return
         
         # Mode 1 joueur: seulement le joueur 1 (ROUGE) peut cliquer
@@ -680,6 +1251,10 @@ class ConnectFourGame:
 
     def handle_game_keys(self, event):
         """Gère les touches en jeu."""
+        if event.key in (pygame.K_m, pygame.K_l, pygame.K_r):
+            # Le thread turbo ne doit plus toucher au plateau
+            self.arreter_turbo()
+        
         if event.key == pygame.K_m:
             self.state = MENU
             self.reset_game_data()
@@ -691,9 +1266,16 @@ class ConnectFourGame:
             self.reset_game_data()
             self.show_temp_message("Jeu réinitialisé!")
         elif event.key == pygame.K_z and pygame.key.get_mods() & pygame.KMOD_CTRL:
-            self.undo_coup()
+            if self.mode_jeu != MODE_TURBO:  # Le thread turbo joue seul
+                self.undo_coup()
         elif event.key == pygame.K_y and pygame.key.get_mods() & pygame.KMOD_CTRL:
-            self.redo_coup()
+            if self.mode_jeu != MODE_TURBO:
+                self.redo_coup()
+        elif event.key == pygame.K_t:
+            self.afficher_stats = not self.afficher_stats
+        elif event.key == pygame.K_e:
+            self.exporter_stats = not self.exporter_stats
+            self.show_temp_message(f"Export stats {'activé' if self.exporter_stats else 'désactivé'}: {FICHIER_STATS}")
 
     def handle_menu_keys(self, event):
         """Gère les touches dans le menu."""
@@ -709,42 +1291,56 @@ class ConnectFourGame:
             self.mode_jeu = 2
             self.reset_game_data()
             self.state = JEU
+        elif event.key == pygame.K_3:
+            self.mode_jeu = MODE_TURBO
+            self.reset_game_data()
+            self.state = JEU
         elif event.key == pygame.K_p:
             self.state = PARAMETRES
         elif event.key == pygame.K_l:
             self.load_last_save()
         elif event.key == pygame.K_q:
-            pygame.quit()
-            sys.exit()
+            self.quitter()
 
     def handle_settings_keys(self, event):
-        """Gère les touches dans les paramètres."""
+        """Gère les touches dans les paramètres.
+
+        Les changements sont seulement notés ici : config.json et la fenêtre
+        sont mis à jour une seule fois en quittant l'écran (quitter_parametres).
+        """
         if event.key == pygame.K_UP:
             self.config["lignes"] = min(12, self.config["lignes"] + 1)
-            self.sauver_config()
-            self.setup_display()
+            self.config_modifiee = True
         elif event.key == pygame.K_DOWN:
             self.config["lignes"] = max(4, self.config["lignes"] - 1)
-            self.sauver_config()
-            self.setup_display()
+            self.config_modifiee = True
         elif event.key == pygame.K_RIGHT:
             self.config["colonnes"] = min(15, self.config["colonnes"] + 1)
-            self.sauver_config()
-            self.setup_display()
+            self.config_modifiee = True
         elif event.key == pygame.K_LEFT:
             self.config["colonnes"] = max(4, self.config["colonnes"] - 1)
-            self.sauver_config()
-            self.setup_display()
+            self.config_modifiee = True
         elif event.key == pygame.K_j:
             self.config["joueur_start"] = 3 - self.config["joueur_start"]
-            self.sauver_config()
+            self.config_modifiee = True
         elif event.key == pygame.K_d:
-            difficulties = [DIFF_ALEATOIRE, DIFF_FACILE, DIFF_MOYEN, DIFF_DIFFICILE]
-            current_idx = difficulties.index(self.difficulte) if self.difficulte in difficulties else 1
-            next_idx = (current_idx + 1) % len(difficulties)
-            self.difficulte = difficulties[next_idx]
+            self.difficulte = self.difficulte_suivante(self.difficulte)
+        elif event.key == pygame.K_1:
+            self.difficulte_turbo[1] = self.difficulte_suivante(self.difficulte_turbo[1])
+        elif event.key == pygame.K_2:
+            self.difficulte_turbo[2] = self.difficulte_suivante(self.difficulte_turbo[2])
         elif event.key == pygame.K_RETURN:
-            self.state = MENU
+            self.quitter_parametres()
+
+    def quitter_parametres(self):
+        """Applique en une fois les changements : écriture de config.json et redimensionnement."""
+        if self.config_modifiee:
+            self.sauver_config()
+        larg = self.config["colonnes"] * TAILLE_CASE
+        haut = self.config["lignes"] * TAILLE_CASE + BANDE_HAUTE
+        if self.ecran.get_size() != (larg, haut):
+            self.setup_display()
+        self.state = MENU
 
     # ============================
     # HELPERS
@@ -755,6 +1351,14 @@ class ConnectFourGame:
         self.temp_message = msg
         self.temp_message_timer = 180  # 3 secondes à 60 FPS
 
+    def quitter(self):
+        """Enregistre le cache d'analyse (et la config si elle n'a jamais été écrite) puis ferme le jeu."""
+        if self.config_modifiee:
+            self.sauver_config()
+        self.cache_analyse.sauver()
+        pygame.quit()
+        sys.exit()
+
     def load_last_save(self):
         """Charge la dernière sauvegarde."""
         saves = [f for f in os.listdir(".") if f.startswith("save_") and f.endswith(".json")]
@@ -774,8 +1378,7 @@ class ConnectFourGame:
             # Événements
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quitter()
                 
                 if event.type == pygame.MOUSEBUTTONDOWN and self.state == JEU:
                     mx, my = pygame.mouse.get_pos()
@@ -789,22 +1392,29 @@ class ConnectFourGame:
                     elif self.state == PARAMETRES:
                         self.handle_settings_keys(event)
             
+            # En turbo, l'affichage est limité pour laisser le calcul au thread IA
+            turbo = self.state == JEU and self.mode_jeu == MODE_TURBO
+            fps = FPS_TURBO if turbo else FPS
+            
             # Mise à jour
             if self.state == JEU:
                 self.update_ai_move()
                 if self.temp_message_timer > 0:
-                    self.temp_message_timer -= 1
+                    self.temp_message_timer -= FPS // fps
             
             # Affichage
             if self.state == MENU:
                 self.draw_menu()
             elif self.state == PARAMETRES:
                 self.draw_settings()
+            elif turbo:
+                with self.turbo_lock:
+                    self.draw_game()
             elif self.state == JEU:
                 self.draw_game()
             
             pygame.display.flip()
-            self.clock.tick(60)
+            self.clock.tick(fps)
 
 
 if __name__ == "__main__":
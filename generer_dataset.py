@@ -0,0 +1,280 @@
+"""Générateur de positions étiquetées pour ajuster l'évaluation de l'IA.
+
+Joue des parties IA contre IA en parallèle (un moteur par processus) et écrit,
+pour chaque position rencontrée :
+  - planes   : plateau en deux plans (ROUGE, JAUNE) compressés avec np.packbits
+  - trait    : joueur au trait (1 = ROUGE, 2 = JAUNE)
+  - score    : meilleur score Minimax du point de vue du joueur au trait
+  - resultat : issue de la partie pour le joueur au trait (1, 0, -1)
+
+Les positions sont écrites dans des fichiers .npy de taille fixe (chunks),
+ouverts en memmap : rien n'est gardé en RAM hormis la partie en cours.
+Un fichier manifest.json décrit les chunks et permet de reprendre une
+génération interrompue (il suffit de relancer la même commande).
+
+Exemple :
+    python generer_dataset.py dataset --positions 10000000 --profondeur 5
+"""
+import argparse
+import copy
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+from game import ConnectFourGame
+
+MANIFEST = "manifest.json"
+VERSION_FORMAT = 1
+TAILLE_CHUNK_DEFAUT = 1 << 20
+
+_moteur = None
+
+
+def dtype_positions(lignes, colonnes):
+    """Retourne le dtype structuré d'une position pour une taille de plateau."""
+    nb_octets = (2 * lignes * colonnes + 7) // 8
+    return np.dtype([
+        ("planes", np.uint8, (nb_octets,)),
+        ("trait", np.uint8),
+        ("score", np.int32),
+        ("resultat", np.int8),
+    ])
+
+
+def encoder_plateau(plateau):
+    """Compresse le plateau en deux plans de bits (ROUGE puis JAUNE)."""
+    board = np.asarray(plateau, dtype=np.uint8)
+    planes = np.stack([board == 1, board == 2])
+    return np.packbits(planes)
+
+
+def decoder_plateau(planes, lignes, colonnes):
+    """Reconstruit le plateau (0, 1, 2) à partir des plans compressés."""
+    bits = np.unpackbits(planes, count=2 * lignes * colonnes).reshape(2, lignes, colonnes)
+    return bits[0] + 2 * bits[1]
+
+
+def charger_dataset(dossier):
+    """Retourne la liste des chunks du dataset ouverts en memmap (lecture seule)."""
+    with open(os.path.join(dossier, MANIFEST), "r") as f:
+        manifest = json.load(f)
+    chunks = []
+    for chunk in manifest["chunks"]:
+        data = np.load(os.path.join(dossier, chunk["fichier"]), mmap_mode="r")
+        chunks.append(data[:chunk["n"]])
+    return chunks
+
+
+# ============================
+# TRAVAIL (processus fils)
+# ============================
+
+def init_worker(lignes, colonnes, profondeur):
+    """Crée le moteur sans affichage du processus courant."""
+    global _moteur
+    _moteur = ConnectFourGame(affichage=False)
+    _moteur.config = {"lignes": lignes, "colonnes": colonnes, "joueur_start": 1}
+    _moteur.mode_jeu = 0
+    _moteur.difficulte = profondeur
+
+
+def jouer_partie(args):
+    """Joue une partie complète et retourne ses positions étiquetées."""
+    graine, ouverture, epsilon = args
+    random.seed(graine)
+    moteur = _moteur
+    moteur.config["joueur_start"] = 1 + graine % 2
+    moteur.reset_game_data()
+
+    positions = []  # (planes, trait, score)
+    while not moteur.game_over:
+        valid_moves = moteur.get_valid_moves(moteur.plateau)
+        planes = encoder_plateau(moteur.plateau)
+        col = moteur.get_ai_move_minimax()
+        score = max(s for s in moteur.scores_ia if s is not None)
+        positions.append((planes, moteur.tour, int(score)))
+        if len(moteur.historique) < ouverture or random.random() < epsilon:
+            col = random.choice(valid_moves)
+        moteur.jouer_coup(col)
+
+    if moteur.gagnants:
+        r, c = moteur.gagnants[0]
+        gagnant = moteur.plateau[r][c]
+    else:
+        gagnant = 0
+    return [
+        (planes, trait, score, 0 if gagnant == 0 else (1 if gagnant == trait else -1))
+        for planes, trait, score in positions
+    ]
+
+
+# ============================
+# ÉCRITURE (processus principal)
+# ============================
+
+class DatasetWriter:
+    """Écrit les positions dans des chunks .npy memmap avec reprise via manifest.json."""
+
+    def __init__(self, dossier, lignes, colonnes, taille_chunk=None, profondeur=None, ouverture=None, epsilon=None):
+        self.dossier = dossier
+        os.makedirs(dossier, exist_ok=True)
+        chemin = os.path.join(dossier, MANIFEST)
+        if os.path.exists(chemin):
+            with open(chemin, "r") as f:
+                self.manifest = json.load(f)
+            attendu = (lignes, colonnes)
+            present = (self.manifest["lignes"], self.manifest["colonnes"])
+            if present != attendu:
+                raise ValueError(f"Dataset existant en {present[0]}x{present[1]}, demandé {lignes}x{colonnes}")
+            # Reprendre avec d'autres réglages mélangerait deux distributions de positions
+            for cle, valeur in (("profondeur", profondeur), ("ouverture", ouverture), ("epsilon", epsilon)):
+                if self.manifest.get(cle) != valeur:
+                    raise ValueError(f"Dataset existant avec {cle}={self.manifest.get(cle)}, demandé {cle}={valeur}")
+            if taille_chunk is not None and taille_chunk != self.manifest["taille_chunk"]:
+                print(f"⚠ --taille-chunk {taille_chunk} ignoré : le dataset existant utilise "
+                      f"{self.manifest['taille_chunk']} positions par chunk.")
+        else:
+            self.manifest = {
+                "version": VERSION_FORMAT,
+                "lignes": lignes,
+                "colonnes": colonnes,
+                "profondeur": profondeur,
+                "ouverture": ouverture,
+                "epsilon": epsilon,
+                "taille_chunk": taille_chunk if taille_chunk is not None else TAILLE_CHUNK_DEFAUT,
+                "parties": 0,
+                "positions": 0,
+                "graine_suivante": None,
+                "chunks": [],
+            }
+        self.dtype = dtype_positions(lignes, colonnes)
+        self.chunk = None
+        self.ouvrir_dernier_chunk()
+
+    @property
+    def total(self):
+        return self.manifest["positions"]
+
+    @property
+    def parties(self):
+        return self.manifest["parties"]
+
+    def ouvrir_dernier_chunk(self):
+        """Rouvre le dernier chunk s'il n'est pas plein (reprise)."""
+        chunks = self.manifest["chunks"]
+        if chunks and chunks[-1]["n"] < self.manifest["taille_chunk"]:
+            chemin = os.path.join(self.dossier, chunks[-1]["fichier"])
+            self.chunk = np.load(chemin, mmap_mode="r+")
+
+    def nouveau_chunk(self):
+        """Crée un nouveau fichier .npy de taille fixe."""
+        fichier = f"positions_{len(self.manifest['chunks']):05d}.npy"
+        self.chunk = np.lib.format.open_memmap(
+            os.path.join(self.dossier, fichier), mode="w+",
+            dtype=self.dtype, shape=(self.manifest["taille_chunk"],))
+        self.manifest["chunks"].append({"fichier": fichier, "n": 0})
+
+    def ajouter_partie(self, positions):
+        """Ajoute les positions d'une partie puis met à jour le manifest."""
+        for planes, trait, score, resultat in positions:
+            if self.chunk is None:
+                self.nouveau_chunk()
+            info = self.manifest["chunks"][-1]
+            rec = self.chunk[info["n"]]
+            rec["planes"] = planes
+            rec["trait"] = trait
+            rec["score"] = score
+            rec["resultat"] = resultat
+            info["n"] += 1
+            if info["n"] == self.manifest["taille_chunk"]:
+                self.chunk.flush()
+                self.chunk = None
+        self.manifest["positions"] += len(positions)
+        self.manifest["parties"] += 1
+
+    def sauver_manifest(self):
+        """Vide le chunk courant sur disque puis écrit le manifest de façon atomique."""
+        if self.chunk is not None:
+            self.chunk.flush()
+        chemin = os.path.join(self.dossier, MANIFEST)
+        with open(chemin + ".tmp", "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(chemin + ".tmp", chemin)
+
+    def fermer(self):
+        self.sauver_manifest()
+        self.chunk = None
+
+
+def generer(args):
+    """Boucle principale : distribue les parties aux processus et écrit les résultats."""
+    writer = DatasetWriter(args.dossier, args.lignes, args.colonnes, args.taille_chunk,
+                           args.profondeur, args.ouverture, args.epsilon)
+    if writer.total >= args.positions:
+        print(f"✓ Dataset déjà complet ({writer.total} positions).")
+        return
+
+    print(f"✓ Reprise à {writer.total} positions / {writer.parties} parties." if writer.total
+          else f"✓ Nouveau dataset dans {args.dossier}.")
+    debut = time.time()
+    depart = writer.total
+    prochaine_graine = writer.manifest["graine_suivante"]
+    if prochaine_graine is None:
+        prochaine_graine = args.graine
+    lot = args.workers * 4
+    # Manifest du dernier lot complet : un lot interrompu (Ctrl+C ou erreur d'un processus
+    # fils) est abandonné en entier, sinon ses graines seraient rejouées à la reprise et
+    # ses parties écrites deux fois
+    valide = copy.deepcopy(writer.manifest)
+    lot_en_cours = False
+    with multiprocessing.Pool(args.workers, initializer=init_worker,
+                              initargs=(args.lignes, args.colonnes, args.profondeur)) as pool:
+        try:
+            while writer.total < args.positions:
+                lot_en_cours = True
+                taches = [(prochaine_graine + i, args.ouverture, args.epsilon) for i in range(lot)]
+                prochaine_graine += lot
+                for positions in pool.imap_unordered(jouer_partie, taches):
+                    writer.ajouter_partie(positions)
+                writer.manifest["graine_suivante"] = prochaine_graine
+                writer.sauver_manifest()
+                valide = copy.deepcopy(writer.manifest)
+                lot_en_cours = False
+                ecoule = time.time() - debut
+                vitesse = (writer.total - depart) / ecoule if ecoule > 0 else 0
+                print(f"  {writer.total} positions, {writer.parties} parties ({vitesse:.0f} pos/s)")
+        except KeyboardInterrupt:
+            print("✗ Interrompu, abandon du lot en cours...")
+        finally:
+            if lot_en_cours:
+                writer.manifest = valide
+            writer.fermer()
+    print(f"✓ Terminé : {writer.total} positions dans {len(writer.manifest['chunks'])} chunk(s).")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère des positions étiquetées par auto-jeu Minimax.")
+    parser.add_argument("dossier", help="Dossier de sortie (reprise automatique s'il existe)")
+    parser.add_argument("--positions", type=int, default=1_000_000, help="Nombre total de positions visé")
+    parser.add_argument("--lignes", type=int, default=6)
+    parser.add_argument("--colonnes", type=int, default=7)
+    parser.add_argument("--profondeur", type=int, default=5, help="Profondeur de recherche Minimax")
+    parser.add_argument("--ouverture", type=int, default=4, help="Nombre de coups aléatoires en début de partie")
+    parser.add_argument("--epsilon", type=float, default=0.1, help="Probabilité de jouer un coup aléatoire ensuite")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--taille-chunk", type=int, default=None,
+                        help=f"Positions par fichier .npy (défaut {TAILLE_CHUNK_DEFAUT}, fixé à la création)")
+    parser.add_argument("--graine", type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.profondeur < 1:
+        parser.error("--profondeur doit être >= 1")
+    generer(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())